@@ -5,7 +5,7 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
@@ -78,25 +78,31 @@ activities = {
 }
 
 
+def get_activities_db():
+    """Provide the activity database (overridable via app.dependency_overrides)"""
+    return activities
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+def get_activities(activities_db: dict = Depends(get_activities_db)):
+    return activities_db
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+def signup_for_activity(activity_name: str, email: str,
+                        activities_db: dict = Depends(get_activities_db)):
     """Sign up a student for an activity"""
     # Validate activity exists
-    if activity_name not in activities:
+    if activity_name not in activities_db:
         raise HTTPException(status_code=404, detail="Activity not found")
 
     # Get the specific activity
-    activity = activities[activity_name]
+    activity = activities_db[activity_name]
 
     #Validate the student is not already signed up
     if email in activity["participants"]:
@@ -108,14 +114,15 @@ def signup_for_activity(activity_name: str, email: str):
 
 
 @app.delete("/activities/{activity_name}/signup/{email}")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str,
+                             activities_db: dict = Depends(get_activities_db)):
     """Remove a student from an activity"""
     # Validate activity exists
-    if activity_name not in activities:
+    if activity_name not in activities_db:
         raise HTTPException(status_code=404, detail="Activity not found")
 
     # Get the specific activity
-    activity = activities[activity_name]
+    activity = activities_db[activity_name]
 
     # Validate student is registered
     if email not in activity["participants"]:
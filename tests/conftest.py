@@ -0,0 +1,51 @@
+"""
+Shared pytest fixtures for the Mergington High School Activities API tests
+"""
+
+import json
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response
+from src.app import app, activities, get_activities_db
+
+# Pristine activities state, serialized once at import before any test mutates it
+_PRISTINE_ACTIVITIES_JSON = json.dumps(activities)
+
+
+_stdlib_response_json = Response.json
+
+
+def _orjson_response_json(self, **kwargs):
+    """Decode a response body with orjson, deferring to httpx when kwargs are given"""
+    # orjson.loads takes no decoder options, so keep httpx's behavior for those calls
+    if kwargs:
+        return _stdlib_response_json(self, **kwargs)
+    return orjson.loads(self.content)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def orjson_responses():
+    """Decode response bodies with orjson instead of the stdlib json module"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Response, "json", _orjson_response_json)
+        yield
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Provide a TestClient for the FastAPI app, shared across the session"""
+    # Entering the client runs the app lifespan once for the whole session
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def activities_store():
+    """Inject a fresh, test-private activities dict into the app"""
+    # json.loads builds fresh dicts and lists, so changes never leak between tests
+    store = json.loads(_PRISTINE_ACTIVITIES_JSON)
+    app.dependency_overrides[get_activities_db] = lambda: store
+    yield store
+    app.dependency_overrides.pop(get_activities_db, None)
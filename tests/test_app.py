@@ -5,238 +5,142 @@ This test suite covers all endpoints with both happy path and error case scenari
 Uses AAA (Arrange-Act-Assert) pattern for clear test structure.
 """
 
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+from fastapi import HTTPException
+from httpx import ASGITransport, AsyncClient
+from src.app import app, signup_for_activity, unregister_from_activity
 
+# Expected values for the read-only tests, built once at import
+EXPECTED_ACTIVITIES = frozenset({
+    "Chess Club", "Programming Class", "Gym Class", "Basketball Team",
+    "Tennis Club", "Drama Club", "Art Studio", "Debate Team", "Science Club"
+})
+REQUIRED_FIELDS = frozenset({"description", "schedule", "max_participants", "participants"})
+CHESS_CLUB_PARTICIPANTS = frozenset({"michael@mergington.edu", "daniel@mergington.edu"})
 
-@pytest.fixture
-def client():
-    """Provide a TestClient for the FastAPI app"""
-    return TestClient(app)
 
+@pytest.fixture(scope="session")
+def activities_response(client):
+    """Fetch GET /activities once per session for the read-only shape tests"""
+    return client.get("/activities")
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to a clean state before each test"""
-    # Arrange: Set up original activities state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball practice and games",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["jacob@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Learn and practice tennis skills",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["mia@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Theater production and performance opportunities",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu", "grace@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Painting, drawing, and sculpture techniques",
-            "schedule": "Mondays and Fridays, 3:30 PM - 4:30 PM",
-            "max_participants": 18,
-            "participants": ["charlotte@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop argumentation and public speaking skills",
-            "schedule": "Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 14,
-            "participants": ["lucas@mergington.edu", "ava@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Explore science through experiments and projects",
-            "schedule": "Mondays, 3:30 PM - 4:30 PM",
-            "max_participants": 22,
-            "participants": ["ethan@mergington.edu"]
-        }
-    }
-    
-    # Clear current activities and repopulate with original
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Cleanup after test (reset again for next test)
-    activities.clear()
-    activities.update(original_activities)
+
+@pytest.fixture(scope="session")
+def activities_data(activities_response):
+    """Decode the GET /activities body once per session"""
+    return activities_response.json()
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
+    def test_get_activities_returns_all_activities(self, activities_response, activities_data):
         """Test that GET /activities returns all available activities"""
-        # Arrange
-        expected_activity_count = 9
-        expected_activities = [
-            "Chess Club", "Programming Class", "Gym Class", "Basketball Team",
-            "Tennis Club", "Drama Club", "Art Studio", "Debate Team", "Science Club"
-        ]
-        
-        # Act
-        response = client.get("/activities")
-        data = response.json()
-        
         # Assert
-        assert response.status_code == 200
-        assert len(data) == expected_activity_count
-        for activity in expected_activities:
-            assert activity in data
+        assert activities_response.status_code == 200
+        assert activities_data.keys() == EXPECTED_ACTIVITIES
     
-    def test_get_activities_returns_correct_structure(self, client):
+    def test_get_activities_returns_correct_structure(self, activities_response, activities_data):
         """Test that activity data has correct structure"""
         # Arrange
-        required_fields = ["description", "schedule", "max_participants", "participants"]
-        test_activity = "Chess Club"
-        
-        # Act
-        response = client.get("/activities")
-        data = response.json()
-        activity = data[test_activity]
+        activity = activities_data["Chess Club"]
         
         # Assert
-        assert response.status_code == 200
-        for field in required_fields:
-            assert field in activity, f"Missing field: {field}"
+        assert activities_response.status_code == 200
+        assert activity.keys() >= REQUIRED_FIELDS
         assert isinstance(activity["participants"], list)
     
-    def test_get_activities_returns_participants(self, client):
+    def test_get_activities_returns_participants(self, activities_response, activities_data):
         """Test that participants list is included and accurate"""
         # Arrange
-        test_activity = "Chess Club"
-        expected_participants = ["michael@mergington.edu", "daniel@mergington.edu"]
-        expected_count = 2
-        
-        # Act
-        response = client.get("/activities")
-        data = response.json()
-        actual_participants = data[test_activity]["participants"]
+        actual_participants = activities_data["Chess Club"]["participants"]
         
         # Assert
-        assert response.status_code == 200
-        assert len(actual_participants) == expected_count
-        for participant in expected_participants:
-            assert participant in actual_participants
+        assert activities_response.status_code == 200
+        assert len(actual_participants) == len(CHESS_CLUB_PARTICIPANTS)
+        assert set(actual_participants) == CHESS_CLUB_PARTICIPANTS
 
 
+@pytest.mark.usefixtures("activities_store")
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_successful(self, client):
-        """Test successful signup for an activity"""
+    @pytest.mark.parametrize("student_email", [
+        "newstudent@mergington.edu",
+        "new+tag@mergington.edu",
+    ], ids=["plain_email", "plus_in_email"])
+    def test_signup_successful(self, client, activities_store, student_email):
+        """Test successful signup stores the email exactly as sent"""
         # Arrange
         activity_name = "Chess Club"
-        student_email = "newstudent@mergington.edu"
         
         # Act
         response = client.post(
-            f"/activities/{activity_name}/signup?email={student_email}"
+            f"/activities/{activity_name}/signup", params={"email": student_email}
         )
-        verification_response = client.get("/activities")
         
         # Assert
         assert response.status_code == 200
         assert "Signed up" in response.json()["message"]
-        assert student_email in verification_response.json()[activity_name]["participants"]
-    
-    def test_signup_multiple_students(self, client):
-        """Test that multiple different students can sign up"""
-        # Arrange
-        activity_name = "Chess Club"
-        student1_email = "student1@mergington.edu"
-        student2_email = "student2@mergington.edu"
-        
-        # Act
-        response1 = client.post(
-            f"/activities/{activity_name}/signup?email={student1_email}"
-        )
-        response2 = client.post(
-            f"/activities/{activity_name}/signup?email={student2_email}"
-        )
-        verification_response = client.get("/activities")
-        participants = verification_response.json()[activity_name]["participants"]
-        
-        # Assert
-        assert response1.status_code == 200
-        assert response2.status_code == 200
-        assert student1_email in participants
-        assert student2_email in participants
+        assert student_email in activities_store[activity_name]["participants"]
     
-    def test_signup_duplicate_prevented(self, client):
-        """Test that duplicate signup is prevented"""
+    def test_signup_missing_email_parameter(self, client):
+        """Test signup without email parameter"""
         # Arrange
         activity_name = "Chess Club"
-        existing_student = "michael@mergington.edu"  # Already registered
+        expected_status = 422  # Unprocessable Entity
         
         # Act
-        response = client.post(
-            f"/activities/{activity_name}/signup?email={existing_student}"
-        )
+        response = client.post(f"/activities/{activity_name}/signup")
         
         # Assert
-        assert response.status_code == 400
-        detail = response.json()["detail"].lower()
-        assert "already" in detail or "signed up" in detail
+        assert response.status_code == expected_status
+        assert response.json()["detail"][0]["loc"] == ["query", "email"]
     
-    def test_signup_activity_not_found(self, client):
-        """Test signup returns 404 for nonexistent activity"""
-        # Arrange
-        activity_name = "Nonexistent Activity"
-        student_email = "student@mergington.edu"
-        
+    @pytest.mark.parametrize("activity_name,email,expected_status,needle", [
+        ("Chess Club", "michael@mergington.edu", 400, "already"),
+        ("Nonexistent Activity", "student@mergington.edu", 404, "not found"),
+    ], ids=["duplicate_prevented", "activity_not_found"])
+    def test_signup_rejected(self, activities_store, activity_name, email, expected_status, needle):
+        """Test signup business rules by calling the handler directly"""
         # Act
-        response = client.post(
-            f"/activities/{activity_name}/signup?email={student_email}"
-        )
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity(activity_name, email, activities_store)
         
         # Assert
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
+        assert exc_info.value.status_code == expected_status
+        assert needle in exc_info.value.detail.lower()
     
-    def test_signup_missing_email_parameter(self, client):
-        """Test signup without email parameter"""
+    def test_signup_multiple_students(self, client, activities_store):
+        """Test that multiple different students can sign up"""
         # Arrange
         activity_name = "Chess Club"
-        expected_status = 422  # Unprocessable Entity
+        student1_email = "student1@mergington.edu"
+        student2_email = "student2@mergington.edu"
         
         # Act
-        response = client.post(f"/activities/{activity_name}/signup")
+        response1 = client.post(
+            f"/activities/{activity_name}/signup", params={"email": student1_email}
+        )
+        response2 = client.post(
+            f"/activities/{activity_name}/signup", params={"email": student2_email}
+        )
+        participants = activities_store[activity_name]["participants"]
         
         # Assert
-        assert response.status_code == expected_status
+        assert response1.status_code == 200
+        assert response2.status_code == 200
+        assert student1_email in participants
+        assert student2_email in participants
 
 
+@pytest.mark.usefixtures("activities_store")
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/signup/{email} endpoint"""
     
-    def test_unregister_successful(self, client):
+    def test_unregister_successful(self, client, activities_store):
         """Test successful unregistration from activity"""
         # Arrange
         activity_name = "Chess Club"
@@ -246,63 +150,44 @@ class TestUnregisterFromActivity:
         response = client.delete(
             f"/activities/{activity_name}/signup/{student_email}"
         )
-        verification_response = client.get("/activities")
-        participants = verification_response.json()[activity_name]["participants"]
         
         # Assert
         assert response.status_code == 200
         assert "Unregistered" in response.json()["message"]
-        assert student_email not in participants
-    
-    def test_unregister_activity_not_found(self, client):
-        """Test unregister returns 404 for nonexistent activity"""
-        # Arrange
-        activity_name = "Nonexistent Activity"
-        student_email = "student@mergington.edu"
-        
-        # Act
-        response = client.delete(
-            f"/activities/{activity_name}/signup/{student_email}"
-        )
-        
-        # Assert
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
+        assert student_email not in activities_store[activity_name]["participants"]
     
-    def test_unregister_participant_not_found(self, client):
-        """Test unregister returns 400 when participant isn't in activity"""
-        # Arrange
-        activity_name = "Chess Club"
-        student_email = "notamember@mergington.edu"
-        
+    @pytest.mark.parametrize("activity_name,email,expected_status,needle", [
+        ("Nonexistent Activity", "student@mergington.edu", 404, "not found"),
+        ("Chess Club", "notamember@mergington.edu", 400, "not registered"),
+    ], ids=["activity_not_found", "participant_not_found"])
+    def test_unregister_rejected(self, activities_store, activity_name, email, expected_status, needle):
+        """Test unregister business rules by calling the handler directly"""
         # Act
-        response = client.delete(
-            f"/activities/{activity_name}/signup/{student_email}"
-        )
+        with pytest.raises(HTTPException) as exc_info:
+            unregister_from_activity(activity_name, email, activities_store)
         
         # Assert
-        assert response.status_code == 400
-        assert "not registered" in response.json()["detail"].lower()
+        assert exc_info.value.status_code == expected_status
+        assert needle in exc_info.value.detail.lower()
     
-    def test_unregister_multiple_times_fails(self, client):
+    def test_unregister_multiple_times_fails(self, activities_store):
         """Test that unregistering twice fails the second time"""
         # Arrange
         activity_name = "Chess Club"
         student_email = "michael@mergington.edu"
         
         # Act - First unregister
-        response1 = client.delete(
-            f"/activities/{activity_name}/signup/{student_email}"
-        )
+        result = unregister_from_activity(activity_name, student_email, activities_store)
+        participants = activities_store[activity_name]["participants"]
         
         # Act - Second unregister (should fail)
-        response2 = client.delete(
-            f"/activities/{activity_name}/signup/{student_email}"
-        )
+        with pytest.raises(HTTPException) as exc_info:
+            unregister_from_activity(activity_name, student_email, activities_store)
         
         # Assert
-        assert response1.status_code == 200
-        assert response2.status_code == 400
+        assert "Unregistered" in result["message"]
+        assert student_email not in participants
+        assert exc_info.value.status_code == 400
 
 
 class TestRootRedirect:
@@ -321,53 +206,56 @@ class TestRootRedirect:
         assert "static" in response.headers["location"]
 
 
+@pytest.mark.asyncio
 class TestIntegrationScenarios:
     """Integration tests for realistic workflows"""
     
-    def test_signup_and_unregister_workflow(self, client):
+    async def test_signup_and_unregister_workflow(self, activities_store):
         """Test complete signup and unregister workflow"""
         # Arrange
         email = "integration@mergington.edu"
         activity = "Chess Club"
         
-        # Act - Sign up
-        signup_response = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
-        check_signed_up = client.get("/activities")
-        signed_up_participants = check_signed_up.json()[activity]["participants"]
-        
-        # Assert signup
-        assert signup_response.status_code == 200
-        assert email in signed_up_participants
-        
-        # Act - Unregister
-        unregister_response = client.delete(
-            f"/activities/{activity}/signup/{email}"
-        )
-        check_unregistered = client.get("/activities")
-        unregistered_participants = check_unregistered.json()[activity]["participants"]
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as async_client:
+            # Act - Sign up
+            signup_response = await async_client.post(
+                f"/activities/{activity}/signup", params={"email": email}
+            )
+            
+            # Assert signup
+            assert signup_response.status_code == 200
+            assert email in activities_store[activity]["participants"]
+            
+            # Act - Unregister
+            unregister_response = await async_client.delete(
+                f"/activities/{activity}/signup/{email}"
+            )
         
         # Assert unregister
         assert unregister_response.status_code == 200
-        assert email not in unregistered_participants
+        assert email not in activities_store[activity]["participants"]
     
-    def test_multiple_activities_independent(self, client):
+    async def test_multiple_activities_independent(self, activities_store):
         """Test that registrations in different activities are independent"""
         # Arrange
         email = "student@mergington.edu"
         activity1 = "Chess Club"
         activity2 = "Programming Class"
         
-        # Act - Sign up for two activities
-        client.post(f"/activities/{activity1}/signup?email={email}")
-        client.post(f"/activities/{activity2}/signup?email={email}")
-        
-        # Act - Unregister from first activity
-        client.delete(f"/activities/{activity1}/signup/{email}")
-        check_response = client.get("/activities")
-        activities_data = check_response.json()
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as async_client:
+            # Act - Sign up for two activities concurrently (different lists, no race)
+            await asyncio.gather(
+                async_client.post(f"/activities/{activity1}/signup", params={"email": email}),
+                async_client.post(f"/activities/{activity2}/signup", params={"email": email}),
+            )
+            
+            # Act - Unregister from first activity
+            await async_client.delete(f"/activities/{activity1}/signup/{email}")
         
         # Assert
-        assert email not in activities_data[activity1]["participants"]
-        assert email in activities_data[activity2]["participants"]
+        assert email not in activities_store[activity1]["participants"]
+        assert email in activities_store[activity2]["participants"]